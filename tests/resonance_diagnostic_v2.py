@@ -14,9 +14,14 @@ Requirements:
     pip install numpy scipy matplotlib pedalboard
 """
 
+import functools
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
 import numpy as np
+import matplotlib
+matplotlib.use('Agg')  # headless; skips interactive-backend setup
 import matplotlib.pyplot as plt
-from scipy import signal
+from scipy import fft, signal
 from scipy.io import wavfile
 import os
 from pathlib import Path
@@ -29,36 +34,68 @@ except ImportError:
     HAS_PEDALBOARD = False
     print("WARNING: pedalboard not installed")
 
+try:
+    import cupy as cp
+    from cupyx.scipy import signal as cp_signal
+    # cupy can import fine on a machine with no usable CUDA device
+    HAS_CUPY = cp.cuda.runtime.getDeviceCount() > 0
+except Exception:
+    HAS_CUPY = False
+
 SAMPLE_RATE = 44100
 OUTPUT_DIR = Path(__file__).parent / "resonance_analysis_v2"
 
+# Write a WAV for every (signal, config) pair. When False, only the
+# dry signals and the worst cases selected for plotting are written.
+WRITE_ALL_WAVS = False
+
 PLUGIN_PATH = os.path.expanduser(
     "~/Library/Audio/Plug-Ins/VST3/Frequency Shifter v47 PhaseBlend.vst3"
 )
 
 
+# Fade ramps reused by every generator call
+_FADE_2205 = np.linspace(0, 1, int(0.05 * SAMPLE_RATE), dtype=np.float32)
+_FADE_4410 = np.linspace(0, 1, int(0.1 * SAMPLE_RATE), dtype=np.float32)
+
+_SILENCE_CACHE = {}
+
+
+def _silence(n):
+    """Shared read-only zeros buffer; every generator appends one."""
+    if n not in _SILENCE_CACHE:
+        buf = np.zeros(n, dtype=np.float32)
+        buf.flags.writeable = False
+        _SILENCE_CACHE[n] = buf
+    return _SILENCE_CACHE[n]
+
+
 def generate_sine_burst(freq=440, duration=1.0, silence=2.0, sample_rate=SAMPLE_RATE):
     """Generate a sine wave burst followed by silence."""
     t_sound = np.arange(int(duration * sample_rate)) / sample_rate
-    t_silence = np.zeros(int(silence * sample_rate))
 
     # Sine with envelope
     sine = np.sin(2 * np.pi * freq * t_sound).astype(np.float32)
 
     # Apply envelope
-    fade_samples = int(0.05 * sample_rate)
-    sine[:fade_samples] *= np.linspace(0, 1, fade_samples)
-    sine[-fade_samples:] *= np.linspace(1, 0, fade_samples)
+    sine[:len(_FADE_2205)] *= _FADE_2205
+    sine[-len(_FADE_2205):] *= _FADE_2205[::-1]
 
-    return np.concatenate([sine * 0.8, t_silence.astype(np.float32)])
+    return np.concatenate([sine * 0.8, _silence(int(silence * sample_rate))])
 
 
 def generate_chord_burst(freqs=[261.63, 329.63, 392.00], duration=1.0, silence=2.0):
     """Generate a chord (multiple sines) followed by silence."""
-    result = np.zeros(int((duration + silence) * SAMPLE_RATE), dtype=np.float32)
-    for freq in freqs:
-        result += generate_sine_burst(freq, duration, silence) / len(freqs)
-    return result
+    t_sound = np.arange(int(duration * SAMPLE_RATE)) / SAMPLE_RATE
+
+    # All components in one broadcasted sin, summed down the freq axis
+    phases = 2 * np.pi * np.asarray(freqs)[:, None] * t_sound[None, :]
+    chord = (np.sin(phases).sum(axis=0) / len(freqs)).astype(np.float32)
+
+    chord[:len(_FADE_2205)] *= _FADE_2205
+    chord[-len(_FADE_2205):] *= _FADE_2205[::-1]
+
+    return np.concatenate([chord * 0.8, _silence(int(silence * SAMPLE_RATE))])
 
 
 def generate_impulse_train(num_impulses=5, interval=0.2, silence=2.0):
@@ -67,27 +104,34 @@ def generate_impulse_train(num_impulses=5, interval=0.2, silence=2.0):
     samples = int(total_duration * SAMPLE_RATE)
     audio = np.zeros(samples, dtype=np.float32)
 
+    # Synthesize the click once and blit it at each impulse position
+    click = (np.sin(np.linspace(0, 10 * np.pi, 100)) * 0.8).astype(np.float32)
     for i in range(num_impulses):
         idx = int(i * interval * SAMPLE_RATE)
-        # Short click
-        audio[idx:idx+100] = np.sin(np.linspace(0, 10*np.pi, 100)) * 0.8
+        audio[idx:idx + len(click)] = click
 
     return audio
 
 
 def generate_sweep(start_freq=100, end_freq=2000, duration=1.0, silence=2.0):
     """Generate a frequency sweep followed by silence."""
-    t = np.arange(int(duration * SAMPLE_RATE)) / SAMPLE_RATE
-    # Logarithmic sweep
-    sweep = signal.chirp(t, start_freq, duration, end_freq, method='logarithmic')
-    sweep = (sweep * 0.8).astype(np.float32)
+    t = np.arange(int(duration * SAMPLE_RATE), dtype=np.float32) / np.float32(SAMPLE_RATE)
+    # Logarithmic sweep, computed directly in float32 - signal.chirp
+    # would allocate a float64 buffer for the whole sweep
+    k = np.float32(np.log(end_freq / start_freq) / duration)
+    phase = np.float32(2 * np.pi * start_freq) * np.expm1(k * t) / k
+    sweep = np.cos(phase) * np.float32(0.8)
 
     # Fade out
-    fade = int(0.1 * SAMPLE_RATE)
-    sweep[-fade:] *= np.linspace(1, 0, fade)
+    sweep[-len(_FADE_4410):] *= _FADE_4410[::-1]
 
-    silence_samples = np.zeros(int(silence * SAMPLE_RATE), dtype=np.float32)
-    return np.concatenate([sweep, silence_samples])
+    return np.concatenate([sweep, _silence(int(silence * SAMPLE_RATE))])
+
+
+@functools.lru_cache(maxsize=1)
+def _get_plugin(path):
+    """Load the plugin once; parameters are mutated per call."""
+    return load_plugin(path)
 
 
 def process_audio(audio, shift_hz, quantize_pct, smear_ms=100, enhanced=True):
@@ -96,7 +140,7 @@ def process_audio(audio, shift_hz, quantize_pct, smear_ms=100, enhanced=True):
         return None
 
     try:
-        plugin = load_plugin(PLUGIN_PATH)
+        plugin = _get_plugin(PLUGIN_PATH)
         plugin.shiftHz = float(shift_hz)
         plugin.quantizeStrength = float(quantize_pct)
         plugin.smear = float(smear_ms)
@@ -111,25 +155,132 @@ def process_audio(audio, shift_hz, quantize_pct, smear_ms=100, enhanced=True):
         return None
 
 
-def compute_spectrogram(audio, nperseg=2048, noverlap=1920):
-    """Compute spectrogram."""
-    f, t, Sxx = signal.spectrogram(
-        audio, fs=SAMPLE_RATE, nperseg=nperseg, noverlap=noverlap,
+def _compute_spectrogram_gpu(audio, nperseg, noverlap):
+    """GPU spectrogram: batches all frame FFTs into one cuFFT plan."""
+    f, t, Sxx = cp_signal.spectrogram(
+        cp.asarray(audio), fs=SAMPLE_RATE, nperseg=nperseg, noverlap=noverlap,
         window='hann', scaling='density'
     )
-    return f, t, 10 * np.log10(Sxx + 1e-10)
+    Sxx_db = 10 * cp.log10(Sxx + 1e-10)
+    return cp.asnumpy(f), cp.asnumpy(t), cp.asnumpy(Sxx_db)
 
 
-def measure_residual_energy(audio, start_time, end_time, freq_range=(20, 8000)):
-    """Measure average energy in a time window."""
-    f, t, Sxx_db = compute_spectrogram(audio)
+_STFT_CACHE = {}
 
-    t_start_idx = np.argmin(np.abs(t - start_time))
-    t_end_idx = np.argmin(np.abs(t - end_time))
-    f_start_idx = np.argmin(np.abs(f - freq_range[0]))
-    f_end_idx = np.argmin(np.abs(f - freq_range[1]))
 
-    return np.mean(Sxx_db[f_start_idx:f_end_idx, t_start_idx:t_end_idx])
+def _get_stft(nperseg, noverlap):
+    """Cached ShortTimeFFT: window, FFT plan and bins built once."""
+    key = (nperseg, noverlap)
+    if key not in _STFT_CACHE:
+        win = signal.windows.hann(nperseg, sym=False).astype(np.float32)
+        _STFT_CACHE[key] = signal.ShortTimeFFT(
+            win, hop=nperseg - noverlap, fs=SAMPLE_RATE, scale_to='psd'
+        )
+    return _STFT_CACHE[key]
+
+
+def compute_spectrogram(audio, nperseg=2048, noverlap=1920):
+    """Compute spectrogram (on the GPU when CuPy sees a device)."""
+    if HAS_CUPY:
+        return _compute_spectrogram_gpu(audio, nperseg, noverlap)
+    SFT = _get_stft(nperseg, noverlap)
+    Sxx = SFT.spectrogram(audio.astype(np.float32, copy=False))
+    # keep the log/mean reductions in float32 - halves memory traffic
+    Sxx = Sxx.astype(np.float32, copy=False)
+    # ShortTimeFFT's 'psd' scaling omits the one-sided doubling that
+    # signal.spectrogram applies; restore it for the interior bins
+    Sxx[1:-1] *= np.float32(2)
+    return SFT.f, SFT.t(len(audio)), 10 * np.log10(Sxx + np.float32(1e-10))
+
+
+_HANN_2048 = signal.windows.hann(2048, sym=False).astype(np.float32)
+
+
+def batch_spectrograms_display(audios, nperseg=2048, hop=128):
+    """Display spectrograms for many clips via one batched rfft.
+
+    Zero-pads the clips to a common length, builds the strided frame
+    view over the whole batch, and runs a single multithreaded rfft so
+    one FFT plan covers every (signal, config) clip. Matches the
+    one-sided density scaling of compute_spectrogram.
+    Returns a list of (f, t, Sxx_db) tuples in input order.
+    """
+    lengths = [len(a) for a in audios]
+    batch = np.zeros((len(audios), max(lengths)), dtype=np.float32)
+    for i, a in enumerate(audios):
+        batch[i, :len(a)] = a
+
+    frames = np.lib.stride_tricks.sliding_window_view(batch, nperseg, axis=1)
+    frames = frames[:, ::hop] * _HANN_2048
+    Z = fft.rfft(frames, axis=2, workers=-1)
+
+    Sxx = (Z.real * Z.real + Z.imag * Z.imag).astype(np.float32, copy=False)
+    Sxx *= np.float32(1.0 / (SAMPLE_RATE * np.sum(_HANN_2048 ** 2)))
+    Sxx[:, :, 1:-1] *= np.float32(2.0)
+    Sxx += np.float32(1e-10)
+    np.log10(Sxx, out=Sxx)
+    Sxx *= np.float32(10.0)
+
+    f = np.arange(nperseg // 2 + 1) * (SAMPLE_RATE / nperseg)
+    specs = []
+    for i, n in enumerate(lengths):
+        n_frames = (n - nperseg) // hop + 1
+        t = (np.arange(n_frames) * hop + nperseg / 2) / SAMPLE_RATE
+        specs.append((f, t, Sxx[i, :n_frames].T))
+    return specs
+
+
+def compute_spectrogram_measure(audio):
+    """Cheap 50%-overlap spectrogram for energy measurements.
+
+    A mean over a time/frequency window does not benefit from the 93.75%
+    overlap used for display, so this does 8x fewer FFTs.
+    """
+    return compute_spectrogram(audio, nperseg=2048, noverlap=1024)
+
+
+def measure_residual_energy(audio, start_time, end_time, freq_range=(20, 8000)):
+    """Measure average energy (dB RMS) in a time window.
+
+    A broadband level needs no STFT: bandpass the window and take the
+    RMS in the time domain, which is O(N) instead of O(N log N) per
+    frame. Spectrograms are only computed for plotting now.
+    """
+    x = audio[int(start_time * SAMPLE_RATE):int(end_time * SAMPLE_RATE)]
+    if len(x) == 0:
+        return -np.inf
+
+    # The band of interest tops out at 8 kHz, so polyphase-decimate to
+    # 16 kHz first - the filter and RMS then run on 2.75x fewer samples.
+    fs = 16000
+    x = signal.resample_poly(x, fs, SAMPLE_RATE)
+    if freq_range[1] >= fs / 2:
+        # upper edge sits at Nyquist after decimation; highpass only
+        sos = signal.butter(4, freq_range[0], btype='high', fs=fs, output='sos')
+    else:
+        sos = signal.butter(4, freq_range, btype='band', fs=fs, output='sos')
+    x = signal.sosfiltfilt(sos, x)
+    return 20 * np.log10(np.sqrt(np.mean(x * x)) + 1e-10)
+
+
+def _run_one(sig_name, sig_audio, cfg):
+    """Process one (signal, config) pair; runs in a worker process.
+
+    The lru_cache on _get_plugin makes the plugin load once per worker.
+    """
+    cfg_name = f"s{cfg['shift']}_q{cfg['quantize']}_sm{cfg['smear']}_e{int(cfg['enhanced'])}"
+    processed = process_audio(
+        sig_audio, cfg['shift'], cfg['quantize'], cfg['smear'], cfg['enhanced']
+    )
+    if processed is None:
+        return sig_name, cfg_name, cfg, None, None
+
+    if WRITE_ALL_WAVS:
+        wavfile.write(
+            OUTPUT_DIR / f"proc_{sig_name}_{cfg_name}.wav", SAMPLE_RATE, processed
+        )
+    residual = measure_residual_energy(processed, 2.0, 3.0)
+    return sig_name, cfg_name, cfg, processed, residual
 
 
 def run_edge_case_tests():
@@ -159,43 +310,38 @@ def run_edge_case_tests():
         {'shift': 500, 'quantize': 50, 'smear': 100, 'enhanced': True},
     ]
 
-    results = {}
+    results = {sig_name: {} for sig_name in test_signals}
 
+    # Save dry signals
     for sig_name, sig_audio in test_signals.items():
-        print(f"\nTesting: {sig_name}")
-        results[sig_name] = {}
-
-        # Save dry signal
         wavfile.write(OUTPUT_DIR / f"dry_{sig_name}.wav", SAMPLE_RATE, sig_audio)
 
-        for cfg in configs:
-            cfg_name = f"s{cfg['shift']}_q{cfg['quantize']}_sm{cfg['smear']}_e{int(cfg['enhanced'])}"
-            print(f"  Config: {cfg_name}")
-
-            processed = process_audio(
-                sig_audio,
-                cfg['shift'],
-                cfg['quantize'],
-                cfg['smear'],
-                cfg['enhanced']
-            )
-
+    # Each (signal, config) pair is independent - fan out across cores
+    with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+        futures = [
+            executor.submit(_run_one, sig_name, sig_audio, cfg)
+            for sig_name, sig_audio in test_signals.items()
+            for cfg in configs
+        ]
+        for future in as_completed(futures):
+            sig_name, cfg_name, cfg, processed, residual = future.result()
             if processed is not None:
-                # Save processed
-                wavfile.write(
-                    OUTPUT_DIR / f"proc_{sig_name}_{cfg_name}.wav",
-                    SAMPLE_RATE, processed
-                )
-
-                # Measure residual energy 1-2s after sound ends
-                # Sound ends at ~1s for most signals
-                residual = measure_residual_energy(processed, 2.0, 3.0)
                 results[sig_name][cfg_name] = {
                     'audio': processed,
                     'residual_db': residual,
                     'config': cfg
                 }
-                print(f"    Residual energy (1-2s after): {residual:.1f} dB")
+                print(f"  {sig_name} | {cfg_name}: "
+                      f"residual (1-2s after) = {residual:.1f} dB")
+
+    # Display spectrograms for every clip in one batched FFT
+    slots = [(sig_name, cfg_name)
+             for sig_name in results for cfg_name in results[sig_name]]
+    if slots:
+        specs = batch_spectrograms_display(
+            [results[s][c]['audio'] for s, c in slots])
+        for (sig_name, cfg_name), spec in zip(slots, specs):
+            results[sig_name][cfg_name]['spec'] = spec
 
     # Generate comparison plot
     create_comparison_plot(test_signals, results, configs)
@@ -236,14 +382,13 @@ def create_comparison_plot(test_signals, results, configs):
     ax.set_title('Residual Energy 1-2s After Input Stops (dB)\n'
                  'Green = Good (<-70dB), Yellow = Warning, Red = Resonance')
 
-    # Add text annotations
-    for i in range(len(sig_names)):
-        for j in range(len(configs)):
-            val = matrix[i, j]
-            if not np.isnan(val):
-                color = 'white' if val > -50 else 'black'
-                ax.text(j, i, f'{val:.0f}', ha='center', va='center',
-                       color=color, fontsize=9)
+    # Add text annotations only where there is a value; colors are
+    # picked vectorized instead of per-cell comparisons
+    cells = np.argwhere(~np.isnan(matrix))
+    colors = np.where(matrix > -50, 'white', 'black')
+    for i, j in cells:
+        ax.text(j, i, f'{matrix[i, j]:.0f}', ha='center', va='center',
+                color=colors[i, j], fontsize=9)
 
     plt.colorbar(im, ax=ax, label='Residual Energy (dB)')
     plt.tight_layout()
@@ -262,6 +407,14 @@ def find_and_plot_worst_cases(results):
 
     worst_cases.sort(reverse=True)
 
+    # The per-config WAV writes were skipped; keep audio for the top 6
+    if not WRITE_ALL_WAVS:
+        for residual, sig_name, cfg_name, data in worst_cases[:6]:
+            wavfile.write(
+                OUTPUT_DIR / f"proc_{sig_name}_{cfg_name}.wav",
+                SAMPLE_RATE, data['audio']
+            )
+
     # Plot top 6 worst cases
     fig, axes = plt.subplots(3, 2, figsize=(14, 12))
     fig.suptitle('Detailed Spectrograms - Highest Residual Energy Cases\n'
@@ -271,8 +424,11 @@ def find_and_plot_worst_cases(results):
         row, col = idx // 2, idx % 2
         ax = axes[row, col]
 
-        f, t, Sxx_db = compute_spectrogram(data['audio'])
-        im = ax.pcolormesh(t, f, Sxx_db, shading='gouraud', cmap='magma', vmin=-80, vmax=0)
+        f, t, Sxx_db = data['spec']
+        # crop to the plotted 0-4 kHz band before building the mesh
+        k = np.searchsorted(f, 4000) + 1
+        im = ax.pcolormesh(t, f[:k], Sxx_db[:k], shading='auto',
+                           rasterized=True, cmap='magma', vmin=-80, vmax=0)
 
         # Mark silence start (varies by signal type)
         ax.axvline(x=1.0, color='cyan', linestyle='--', linewidth=1, alpha=0.7)
@@ -307,12 +463,20 @@ def analyze_frequency_bands():
         print("Could not process audio")
         return
 
-    # Analyze energy in different bands during silence period
-    f, t, Sxx_db = compute_spectrogram(processed)
-
-    # Time window: 1.5-2.5s (during silence)
-    t_start = np.argmin(np.abs(t - 1.5))
-    t_end = np.argmin(np.abs(t - 2.5))
+    # Analyze energy in different bands during the 1.5-2.5s silence
+    # window; STFT only that slice (plus one frame of pad) instead of
+    # the whole clip.
+    win_start, win_end = 1.5, 2.5
+    pad = 2048 / SAMPLE_RATE
+    s0 = max(0, int((win_start - pad) * SAMPLE_RATE))
+    f, t, Sxx_db = compute_spectrogram_measure(
+        processed[s0:int((win_end + pad) * SAMPLE_RATE)])
+    t = t + s0 / SAMPLE_RATE
+
+    # t and f are monotonic, so searchsorted finds the bins without an
+    # abs-diff temporary.
+    t_start = np.searchsorted(t, win_start)
+    t_end = np.searchsorted(t, win_end)
 
     bands = [
         (20, 100, 'Sub-bass'),
@@ -331,13 +495,20 @@ def analyze_frequency_bands():
     band_names = []
     band_energies = []
 
-    for f_low, f_high, name in bands:
-        f_low_idx = np.argmin(np.abs(f - f_low))
-        f_high_idx = np.argmin(np.abs(f - f_high))
+    edges = np.array([b[0] for b in bands] + [bands[-1][1]])
+    band_idx = np.searchsorted(f, edges)
 
-        avg_energy = np.mean(Sxx_db[f_low_idx:f_high_idx, t_start:t_end])
-        max_energy = np.max(Sxx_db[f_low_idx:f_high_idx, t_start:t_end])
+    # Collapse all bands in one pass: reduce time first (rows have equal
+    # counts, so the grouped means match the per-band slice means), then
+    # group the frequency axis with reduceat.
+    region = Sxx_db[band_idx[0]:band_idx[-1], t_start:t_end]
+    offsets = band_idx[:-1] - band_idx[0]
+    avg_energies = (np.add.reduceat(region.mean(axis=1), offsets)
+                    / np.diff(band_idx))
+    max_energies = np.maximum.reduceat(region.max(axis=1), offsets)
 
+    for (f_low, f_high, name), avg_energy, max_energy in zip(
+            bands, avg_energies, max_energies):
         print(f"{name:15s} ({f_low:4d}-{f_high:4d}Hz): avg={avg_energy:.1f}dB, max={max_energy:.1f}dB")
 
         band_names.append(f"{name}\n{f_low}-{f_high}Hz")